@@ -1,6 +1,8 @@
 import abc
+import math
 
 import beartype.typing as tp
+import jax
 import jax.numpy as jnp
 from jaxtyping import Float
 import numpy as np
@@ -13,6 +15,10 @@ L = tp.TypeVar(
 )
 GL = tp.TypeVar("GL", bound="gpjax.likelihoods.Gaussian")  # noqa: F821
 
+# A Python float, so it is embedded in traced programs as a literal rather than
+# recomputed by a traced `jnp` op on every call.
+_LOG_2PI = math.log(2.0 * math.pi)
+
 
 class AbstractIntegrator:
     r"""Base class for integrators."""
@@ -78,14 +84,41 @@ class GHQuadratureIntegrator(AbstractIntegrator):
     [link](https://keisan.casio.com/exec/system/1281195844).
     """
 
-    def __init__(self, num_points: int = 20):
+    def __init__(
+        self,
+        num_points: int = 20,
+        batch_size: int | None = None,
+        mixed_precision: bool = False,
+    ):
         r"""Initialize the integrator.
 
         Args:
             num_points (int, optional): The number of points to use in the
                 quadrature. Defaults to 20.
+            batch_size (int | None, optional): If given, the integrand is evaluated
+                over the quadrature points in batches of this size with
+                `jax.lax.scan`, accumulating a running weighted sum, rather than
+                all at once. This bounds the memory footprint for large datasets
+                at the cost of some speed. Defaults to None, which evaluates every
+                quadrature point in one pass.
+            mixed_precision (bool, optional): If True, the latent function values
+                at the quadrature points are cast to `bfloat16` before the integrand
+                is evaluated. The observations keep their dtype, so integer counts
+                and regression targets are not rounded, and the weighted sum over
+                quadrature points is accumulated in the dtype of `mean`. This halves
+                the memory traffic of the latent values on accelerators. Defaults to
+                False.
         """
         self.num_points = num_points
+        self.batch_size = batch_size
+        self.mixed_precision = mixed_precision
+        # The quadrature rule depends only on `num_points`, so compute it once here
+        # rather than on every call to `integrate`. The change of variables from a
+        # Gaussian to the Hermite weight function, f = m + sqrt(2 s) t with weights
+        # w / sqrt(pi), is folded into the rule so these scalings are host constants.
+        gh_points, gh_weights = np.polynomial.hermite.hermgauss(num_points)
+        self._gh_points = np.sqrt(2.0) * gh_points
+        self._gh_weights = gh_weights / np.sqrt(np.pi)
 
     def integrate(
         self,
@@ -97,6 +130,14 @@ class GHQuadratureIntegrator(AbstractIntegrator):
     ) -> Float[Array, " N"]:
         r"""Compute a quadrature integral.
 
+        The integrand is evaluated at many quadrature nodes in a single call, so
+        `fun(x, y)` receives the nodes `x` as an array of shape (J, N, D), where J
+        is the number of quadrature points (or `batch_size`, if given), alongside
+        `y` of shape (N, D). `fun` must therefore broadcast `y` against the
+        leading quadrature axis of `x`, as elementwise log-densities do, and return
+        an array of shape (J, N, D). The result is the quadrature-weighted sum of
+        that array over both the J and D axes.
+
         Args:
             fun: the likelihood to be integrated.
             y: the observed response variable.
@@ -107,12 +148,37 @@ class GHQuadratureIntegrator(AbstractIntegrator):
         Returns:
             The expected log likelihood as an array of shape (N,).
         """
-        gh_points, gh_weights = np.polynomial.hermite.hermgauss(self.num_points)
-        sd = jnp.sqrt(variance)
-        X = mean + jnp.sqrt(2.0) * sd * gh_points
-        W = gh_weights / jnp.sqrt(jnp.pi)
-        val = jnp.sum(fun(X, y) * W, axis=1)
-        return val
+        dtype = mean.dtype
+        scale = jnp.sqrt(variance)
+
+        def weighted_sum(points, weights):
+            # Broadcast the nodes along a leading axis, giving (J, N, D).
+            X = mean + scale * points[:, None, None]
+            if self.mixed_precision:
+                integrand = fun(X.astype(jnp.bfloat16), y).astype(dtype)
+            else:
+                integrand = fun(X, y)
+            return jnp.einsum("j,jnd->n", weights, integrand)
+
+        if self.batch_size is None:
+            return weighted_sum(self._gh_points, self._gh_weights)
+
+        # Scan over batches of quadrature points with a running (N,) sum, forming
+        # the nodes inside the loop so that at most a (batch_size, N, D) slice is
+        # live at once. The rule is padded with zero-weight points at t = 0 (the
+        # mean) so that it divides evenly into batches.
+        pad = -self.num_points % self.batch_size
+        points = np.pad(self._gh_points, (0, pad)).reshape(-1, self.batch_size)
+        weights = np.pad(self._gh_weights, (0, pad)).reshape(-1, self.batch_size)
+
+        def accumulate(total, batch):
+            return total + weighted_sum(*batch), None
+
+        init = jax.eval_shape(weighted_sum, points[0], weights[0])
+        total, _ = jax.lax.scan(
+            accumulate, jnp.zeros(init.shape, init.dtype), (points, weights)
+        )
+        return total
 
 
 class AnalyticalGaussianIntegrator(AbstractIntegrator):
@@ -150,9 +216,8 @@ class AnalyticalGaussianIntegrator(AbstractIntegrator):
         """
         obs_stddev = likelihood.obs_stddev.value.squeeze()
         sq_error = jnp.square(y - mean)
-        log2pi = jnp.log(2.0 * jnp.pi)
         val = jnp.sum(
-            log2pi + jnp.log(obs_stddev**2) + (sq_error + variance) / obs_stddev**2,
+            _LOG_2PI + jnp.log(obs_stddev**2) + (sq_error + variance) / obs_stddev**2,
             axis=1,
         )
         return -0.5 * val
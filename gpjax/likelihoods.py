@@ -12,10 +12,11 @@
 # ==============================================================================
 
 import abc
+import math
 
 import beartype.typing as tp
 from flax import nnx
-from jax import vmap
+import jax
 import jax.numpy as jnp
 import jax.scipy as jsp
 from jaxtyping import Float
@@ -27,6 +28,7 @@ from gpjax.integrators import (
     AnalyticalGaussianIntegrator,
     GHQuadratureIntegrator,
 )
+from gpjax.numpyro_extras import LogRatePoisson
 from gpjax.parameters import (
     PositiveReal,
     Static,
@@ -36,6 +38,13 @@ from gpjax.typing import (
     ScalarFloat,
 )
 
+_LOG_2PI = math.log(2.0 * math.pi)
+
+# Affine rescaling applied by `inv_probit` to keep its output in (0, 1).
+_PROBIT_JITTER = 1e-3
+_PROBIT_SCALE = 1.0 - 2.0 * _PROBIT_JITTER
+_PROBIT_OFFSET = _PROBIT_JITTER
+
 
 class AbstractLikelihood(nnx.Module):
     r"""Abstract base class for likelihoods.
@@ -99,6 +108,32 @@ class AbstractLikelihood(nnx.Module):
         """
         raise NotImplementedError
 
+    def log_prob(
+        self, f: Float[Array, "..."], y: Float[Array, "..."]
+    ) -> Float[Array, "..."]:
+        r"""Evaluate the pointwise log-density of the observations.
+
+        Subclasses may override this with a closed-form expression to avoid
+        constructing the intermediate distribution returned by `link_function`. The
+        two must agree: a subclass that changes `link_function` must also override
+        `log_prob`, or fall back to this implementation. The closed forms of the
+        built-in likelihoods fall back automatically when `link_function` has been
+        overridden.
+
+        Args:
+            f (Float[Array, "..."]): the latent Gaussian process values.
+            y (Float[Array, "..."]): the observed response variable.
+
+        Returns:
+            Float[Array, "..."]: The log-density of y given f, broadcast over the
+                shapes of f and y.
+        """
+        return self.link_function(f).log_prob(y)
+
+    def _uses_link_function_of(self, cls: type["AbstractLikelihood"]) -> bool:
+        r"""Whether this likelihood still uses the `link_function` of `cls`."""
+        return type(self).link_function is cls.link_function
+
     def expected_log_likelihood(
         self,
         y: Float[Array, "N D"],
@@ -121,9 +156,8 @@ class AbstractLikelihood(nnx.Module):
         Returns:
             ScalarFloat: The expected log likelihood.
         """
-        log_prob = vmap(lambda f, y: self.link_function(f).log_prob(y))
         return self.integrator(
-            fun=log_prob, y=y, mean=mean, variance=variance, likelihood=self
+            fun=self.log_prob, y=y, mean=mean, variance=variance, likelihood=self
         )
 
 
@@ -154,6 +188,14 @@ class Gaussian(AbstractLikelihood):
 
         super().__init__(num_datapoints, integrator)
 
+    def _obs_stddev_like(self, f: Float[Array, "..."]) -> Float[Array, "..."]:
+        r"""The observation noise standard deviation in the dtype of `f`."""
+        obs_stddev = self.obs_stddev.value
+        # `astype` always emits a conversion, so only cast when the dtypes differ.
+        if obs_stddev.dtype != f.dtype:
+            obs_stddev = obs_stddev.astype(f.dtype)
+        return obs_stddev
+
     def link_function(self, f: Float[Array, "..."]) -> npd.Normal:
         r"""The link function of the Gaussian likelihood.
 
@@ -163,7 +205,29 @@ class Gaussian(AbstractLikelihood):
         Returns:
             npd.Normal: The likelihood function.
         """
-        return npd.Normal(loc=f, scale=self.obs_stddev.value.astype(f.dtype))
+        return npd.Normal(loc=f, scale=self._obs_stddev_like(f))
+
+    def log_prob(
+        self, f: Float[Array, "..."], y: Float[Array, "..."]
+    ) -> Float[Array, "..."]:
+        r"""The log-density of the Gaussian likelihood.
+
+        Args:
+            f (Float[Array, "..."]): Function values.
+            y (Float[Array, "..."]): Observed values.
+
+        Returns:
+            Float[Array, "..."]: The log-density of y given f.
+        """
+        if not self._uses_link_function_of(Gaussian):
+            return super().log_prob(f, y)
+
+        obs_stddev = self._obs_stddev_like(f)
+        return (
+            -0.5 * jnp.square((y - f) / obs_stddev)
+            - jnp.log(obs_stddev)
+            - 0.5 * _LOG_2PI
+        )
 
     def predict(
         self, dist: tp.Union[npd.MultivariateNormal, GaussianDistribution]
@@ -184,7 +248,8 @@ class Gaussian(AbstractLikelihood):
         """
         n_data = dist.event_shape[0]
         cov = dist.covariance_matrix
-        noisy_cov = cov.at[jnp.diag_indices(n_data)].add(self.obs_stddev.value**2)
+        noise = jnp.square(self.obs_stddev.value).astype(cov.dtype)
+        noisy_cov = cov + noise * jnp.eye(n_data, dtype=cov.dtype)
 
         return npd.MultivariateNormal(dist.mean, noisy_cov)
 
@@ -201,6 +266,24 @@ class Bernoulli(AbstractLikelihood):
         """
         return npd.Bernoulli(probs=inv_probit(f))
 
+    def log_prob(
+        self, f: Float[Array, "..."], y: Float[Array, "..."]
+    ) -> Float[Array, "..."]:
+        r"""The log-probability of the Bernoulli likelihood.
+
+        Args:
+            f (Float[Array, "..."]): Function values.
+            y (Float[Array, "..."]): Observed binary values.
+
+        Returns:
+            Float[Array, "..."]: The log-probability of y given f.
+        """
+        if not self._uses_link_function_of(Bernoulli):
+            return super().log_prob(f, y)
+
+        p = inv_probit(f)
+        return jsp.special.xlogy(y, p) + jsp.special.xlog1py(1.0 - y, -p)
+
     def predict(
         self, dist: tp.Union[npd.MultivariateNormal, GaussianDistribution]
     ) -> npd.BernoulliProbs:
@@ -211,27 +294,67 @@ class Bernoulli(AbstractLikelihood):
 
         Args:
             dist ([npd.MultivariateNormal, GaussianDistribution].): The Gaussian
-                process posterior, evaluated at a finite set of test points.
+                process posterior, evaluated at a finite set of test points. A
+                `npd.MultivariateNormal` with batch shape `(B,)`, e.g., posteriors
+                under an ensemble of hyperparameters, is evaluated in a single
+                vectorised call and gives a predictive batch shape of `(B, N)`.
+
+        Returns:
+            npd.Bernoulli: The pointwise predictive distribution.
+        """
+        return self.predict_from_moments(dist.mean, dist.variance)
+
+    def predict_from_moments(
+        self, mean: Float[Array, "..."], variance: Float[Array, "..."]
+    ) -> npd.BernoulliProbs:
+        r"""Evaluate the pointwise predictive distribution from marginal moments.
+
+        Only the marginal means and variances of the Gaussian process posterior are
+        required. Posteriors with a low-rank or diagonal covariance can therefore
+        supply the variances directly, without forming the full covariance matrix.
+
+        Args:
+            mean (Float[Array, "..."]): The marginal means of the posterior.
+            variance (Float[Array, "..."]): The marginal variances of the posterior.
 
         Returns:
             npd.Bernoulli: The pointwise predictive distribution.
         """
-        variance = jnp.diag(dist.covariance_matrix)
-        mean = dist.mean.ravel()
-        return self.link_function(mean / jnp.sqrt(1.0 + variance))
+        return self.link_function(mean * jax.lax.rsqrt(1.0 + variance))
 
 
 class Poisson(AbstractLikelihood):
     def link_function(self, f: Float[Array, "..."]) -> npd.Poisson:
         r"""The link function of the Poisson likelihood.
 
+        The function values are taken as the log-rate. They are clipped from above
+        so that the rate, `exp(f)`, cannot overflow to infinity in the dtype of `f`.
+
         Args:
             f (Float[Array, "..."]): Function values.
 
         Returns:
             npd.Poisson: The likelihood function.
         """
-        return npd.Poisson(rate=jnp.exp(f))
+        return LogRatePoisson(log_rate=_clip_log_rate(f))
+
+    def log_prob(
+        self, f: Float[Array, "..."], y: Float[Array, "..."]
+    ) -> Float[Array, "..."]:
+        r"""The log-probability of the Poisson likelihood.
+
+        Args:
+            f (Float[Array, "..."]): Function values, i.e., the log-rate.
+            y (Float[Array, "..."]): Observed counts.
+
+        Returns:
+            Float[Array, "..."]: The log-probability of y given f.
+        """
+        if not self._uses_link_function_of(Poisson):
+            return super().log_prob(f, y)
+
+        f = _clip_log_rate(f)
+        return y * f - jnp.exp(f) - jsp.special.gammaln(y + 1.0)
 
     def predict(
         self, dist: tp.Union[npd.MultivariateNormal, GaussianDistribution]
@@ -243,12 +366,46 @@ class Poisson(AbstractLikelihood):
 
         Args:
             dist (tp.Union[npd.MultivariateNormal, GaussianDistribution]): The Gaussian
-                process posterior, evaluated at a finite set of test points.
+                process posterior, evaluated at a finite set of test points. As for
+                `Bernoulli.predict`, a leading batch dimension is preserved.
 
         Returns:
             npd.Poisson: The pointwise predictive distribution.
         """
-        return self.link_function(dist.mean)
+        return self.predict_from_moments(dist.mean)
+
+    def predict_from_moments(self, mean: Float[Array, "..."]) -> npd.Poisson:
+        r"""Evaluate the pointwise predictive distribution from marginal moments.
+
+        The Poisson predictive distribution depends only on the marginal means of
+        the Gaussian process posterior, so no covariance information is needed.
+
+        Args:
+            mean (Float[Array, "..."]): The marginal means of the posterior.
+
+        Returns:
+            npd.Poisson: The pointwise predictive distribution.
+        """
+        return self.link_function(mean)
+
+
+def _clip_log_rate(f: Float[Array, " *N"]) -> Float[Array, " *N"]:
+    r"""Clip a log-rate so that its exponential is finite in the dtype of `f`.
+
+    Without this, `exp(f)` overflows for `f` above roughly 88 in single precision
+    (709 in double precision), giving infinite rates and NaN log-probabilities. The
+    cap is 90% of that threshold, about 80 (639), so that sums of many clipped
+    terms, e.g. over the data in the ELBO, also remain finite.
+
+    Args:
+        f (Float[Array, "*N"]): A vector of log-rates.
+
+    Returns
+    -------
+        Float[Array, "*N"]: The clipped log-rates.
+    """
+    f = jnp.asarray(f)
+    return jnp.minimum(f, 0.9 * math.log(jnp.finfo(f.dtype).max))
 
 
 def inv_probit(x: Float[Array, " *N"]) -> Float[Array, " *N"]:
@@ -261,8 +418,10 @@ def inv_probit(x: Float[Array, " *N"]) -> Float[Array, " *N"]:
     -------
         Float[Array, "*N"]: The inverse probit of the input vector.
     """
-    jitter = 1e-3  # To ensure output is in interval (0, 1).
-    return 0.5 * (1.0 + jsp.special.erf(x / jnp.sqrt(2.0))) * (1 - 2 * jitter) + jitter
+    # Evaluate in at least single precision to keep the tails accurate, e.g. when
+    # the integrand of a mixed precision quadrature is evaluated in bfloat16.
+    x = jnp.asarray(x, dtype=jnp.promote_types(jnp.result_type(x), jnp.float32))
+    return _PROBIT_SCALE * jsp.stats.norm.cdf(x) + _PROBIT_OFFSET
 
 
 NonGaussian = tp.Union[Poisson, Bernoulli]
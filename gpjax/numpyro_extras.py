@@ -2,7 +2,10 @@ import math
 
 import jax
 import jax.numpy as jnp
+from jax.scipy.special import gammaln
+import numpyro.distributions as npd
 from numpyro.distributions.transforms import Transform
+from numpyro.distributions.util import validate_sample
 
 # -----------------------------------------------------------------------------
 # Implementation: FillTriangularTransform
@@ -104,3 +107,35 @@ class FillTriangularTransform(Transform):
     @classmethod
     def tree_unflatten(cls, aux_data, children):
         return cls()
+
+
+# -----------------------------------------------------------------------------
+# Implementation: LogRatePoisson
+# -----------------------------------------------------------------------------
+
+
+class LogRatePoisson(npd.Poisson):
+    """
+    Poisson distribution parameterised by the logarithm of its rate.
+
+    numpyro's `Poisson` only accepts `rate`, so a rate formed as `exp(log_rate)`
+    has its logarithm recomputed inside `log_prob`. Keeping `log_rate` around
+    lets `log_prob` use it directly, which is cheaper and avoids `log(exp(f))`
+    losing precision for large negative `f`.
+    """
+
+    pytree_data_fields = ("log_rate",)
+
+    def __init__(self, log_rate, *, is_sparse=False, validate_args=None):
+        self.log_rate = log_rate
+        super().__init__(
+            jnp.exp(log_rate), is_sparse=is_sparse, validate_args=validate_args
+        )
+
+    @validate_sample
+    def log_prob(self, value):
+        if self.is_sparse:
+            return super().log_prob(value)
+        if self._validate_args:
+            self._validate_sample(value)
+        return self.log_rate * value - gammaln(value + 1) - self.rate
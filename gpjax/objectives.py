@@ -226,12 +226,12 @@ def log_posterior_density(
     # f(x) = mx  +  Lx wx
     fx = mx + Lx @ wx
 
-    # p(y | f(x), θ), where θ are the model hyperparameters
-    likelihood = posterior.likelihood.link_function(fx)
+    # log p(y | f(x), θ), where θ are the model hyperparameters
+    log_likelihood = posterior.likelihood.log_prob(fx, y)
 
     # Whitened latent function values prior, p(wx | θ) = N(0, I)
     latent_prior = npd.Normal(loc=0.0, scale=1.0)
-    return likelihood.log_prob(y).sum() + latent_prior.log_prob(wx).sum()
+    return log_likelihood.sum() + latent_prior.log_prob(wx).sum()
 
 
 non_conjugate_mll = log_posterior_density
@@ -19,6 +19,7 @@ import typing as tp
 import jax
 from jax import config
 import jax.numpy as jnp
+import jax.scipy as jsp
 import numpy as np
 import pytest
 
@@ -26,6 +27,7 @@ from gpjax.integrators import GHQuadratureIntegrator
 from gpjax.likelihoods import (
     Bernoulli,
     Gaussian,
+    Poisson,
 )
 
 # Enable Float64 for more stable matrix inversions.
@@ -56,6 +58,81 @@ def test_quadrature(jit: bool, num_points: int):
     assert test() == 6.0
 
 
+@pytest.mark.parametrize("batch_size", [1, 3, 20])
+def test_quadrature_batched(batch_size: int):
+    def fun(x, y):
+        return jnp.sin(x) * y
+
+    mean = jnp.linspace(-1.0, 1.0, 5)[:, None]
+    variance = jnp.linspace(0.1, 1.0, 5)[:, None]
+    y = jnp.ones_like(mean)
+    expected = GHQuadratureIntegrator(num_points=20).integrate(
+        fun=fun, mean=mean, variance=variance, y=y, likelihood=None
+    )
+    batched = GHQuadratureIntegrator(num_points=20, batch_size=batch_size).integrate(
+        fun=fun, mean=mean, variance=variance, y=y, likelihood=None
+    )
+    np.testing.assert_allclose(batched, expected, atol=1e-12)
+
+
+def test_quadrature_batched_memory():
+    # The batched path should only ever hold a (batch_size, N, D) slice of the
+    # integrand, so its compiled scratch memory must undercut the default path.
+    n = 10_000
+    y = jnp.ones((n, 1))
+    mean = jnp.zeros((n, 1))
+    variance = jnp.ones((n, 1))
+
+    def temp_size(integrator):
+        likelihood = Poisson(num_datapoints=n, integrator=integrator)
+        ell = jax.jit(
+            lambda y, m, v: likelihood.expected_log_likelihood(y=y, mean=m, variance=v)
+        )
+        compiled = ell.lower(y, mean, variance).compile()
+        return compiled.memory_analysis().temp_size_in_bytes
+
+    default = temp_size(GHQuadratureIntegrator(num_points=20))
+    batched = temp_size(GHQuadratureIntegrator(num_points=20, batch_size=1))
+    assert batched < default
+
+
+@pytest.mark.parametrize("likelihood", [Gaussian, Bernoulli, Poisson])
+@pytest.mark.parametrize("batch_size", [None, 5])
+def test_quadrature_mixed_precision(likelihood, batch_size):
+    mean = jnp.linspace(-1.0, 1.0, 5)[:, None]
+    variance = jnp.linspace(0.1, 1.0, 5)[:, None]
+    y = jnp.array([[0.0], [1.0], [1.0], [0.0], [1.0]])
+
+    expected = likelihood(num_datapoints=5).expected_log_likelihood(
+        y=y, mean=mean, variance=variance
+    )
+    integrator = GHQuadratureIntegrator(mixed_precision=True, batch_size=batch_size)
+    ell = likelihood(num_datapoints=5, integrator=integrator).expected_log_likelihood(
+        y=y, mean=mean, variance=variance
+    )
+
+    assert ell.dtype == mean.dtype
+    np.testing.assert_allclose(ell, expected, rtol=2e-2)
+
+
+def test_quadrature_mixed_precision_large_counts():
+    # bfloat16 only represents integers exactly up to 256. The counts must keep
+    # their dtype, otherwise e.g. 257 is rounded to 256 and log(y!) is shifted by
+    # log(257). A latent mean of zero keeps the rounding of the nodes negligible.
+    y = jnp.array([[257.0], [300.0], [1001.0]])
+    mean = jnp.zeros_like(y)
+    variance = jnp.full_like(y, 1e-4)
+
+    expected = Poisson(num_datapoints=3).expected_log_likelihood(
+        y=y, mean=mean, variance=variance
+    )
+    integrator = GHQuadratureIntegrator(mixed_precision=True)
+    ell = Poisson(num_datapoints=3, integrator=integrator).expected_log_likelihood(
+        y=y, mean=mean, variance=variance
+    )
+    np.testing.assert_allclose(ell, expected, atol=1e-2)
+
+
 @pytest.mark.parametrize("jit", [True, False])
 @pytest.mark.parametrize(
     "params", [(0.5, -4.22579135), (1.0, -1.91893853), (0.01, -9996.31376835)]
@@ -90,3 +167,23 @@ def test_bernoulli_quadrature(jit: bool, params: tp.Tuple[float, float]):
         ell_fn = likelihood.expected_log_likelihood
     ell = ell_fn(y=y, mean=mu, variance=variance)
     np.testing.assert_almost_equal(ell, expected)
+
+
+@pytest.mark.parametrize("jit", [True, False])
+@pytest.mark.parametrize("n", [1, 5])
+def test_poisson_quadrature(jit: bool, n: int):
+    # For log-rate f ~ N(m, v), E[log p(y|f)] = y m - exp(m + v / 2) - log(y!).
+    mu = jnp.linspace(-1.0, 1.0, n)[:, None]
+    variance = jnp.linspace(0.1, 0.5, n)[:, None]
+    y = jnp.arange(n, dtype=mu.dtype)[:, None]
+    likelihood = Poisson(num_datapoints=n)
+
+    if jit:
+        ell_fn = jax.jit(likelihood.expected_log_likelihood)
+    else:
+        ell_fn = likelihood.expected_log_likelihood
+    ell = ell_fn(y=y, mean=mu, variance=variance)
+    expected = y * mu - jnp.exp(mu + variance / 2.0) - jsp.special.gammaln(y + 1.0)
+
+    assert ell.shape == (n,)
+    np.testing.assert_allclose(ell, expected.squeeze(-1), rtol=1e-6)
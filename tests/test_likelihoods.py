@@ -18,9 +18,13 @@ from typing import (
     Tuple,
 )
 
+import cola
+from cola.ops import Dense
+import jax
 from jax import config
 import jax.numpy as jnp
 import jax.random as jr
+import jax.scipy as jsp
 from jaxtyping import (
     Array,
     Float,
@@ -29,6 +33,7 @@ import numpy as np
 import numpyro.distributions as npd
 import pytest
 
+from gpjax.distributions import GaussianDistribution
 from gpjax.likelihoods import (
     Bernoulli,
     Gaussian,
@@ -74,6 +79,27 @@ def test_gaussian_likelihood(n: int, obs_stddev: float):
     )
 
 
+@pytest.mark.parametrize("n", [1, 2, 10])
+def test_gaussian_heteroscedastic_predict(n: int):
+    obs_stddev = jnp.linspace(0.1, 1.0, n)
+    likelihood = Gaussian(num_datapoints=n, obs_stddev=obs_stddev)
+
+    latent_dist, latent_mean, latent_cov = _compute_latent_dist(n)
+    pred_dist = likelihood(latent_dist)
+
+    assert np.allclose(
+        pred_dist.covariance_matrix, latent_cov + jnp.diag(obs_stddev**2)
+    )
+
+
+def test_gaussian_predict_dtype():
+    likelihood = Gaussian(num_datapoints=3, obs_stddev=jnp.array(0.5, jnp.float64))
+    latent_dist = npd.MultivariateNormal(
+        jnp.zeros(3, jnp.float32), covariance_matrix=jnp.eye(3, dtype=jnp.float32)
+    )
+    assert likelihood(latent_dist).covariance_matrix.dtype == jnp.float32
+
+
 @pytest.mark.parametrize("n", [1, 2, 10])
 def test_bernoulli_likelihood(n: int):
     x = jnp.linspace(-3.0, 3.0).reshape(-1, 1)
@@ -89,8 +115,24 @@ def test_bernoulli_likelihood(n: int):
 
     # Check predictive mean and variance.
     p = inv_probit(latent_mean / jnp.sqrt(1.0 + jnp.diagonal(latent_cov)))
-    assert (pred_dist.mean == p).all()
-    assert (pred_dist.variance == p * (1.0 - p)).all()
+    assert np.allclose(pred_dist.mean, p)
+    assert np.allclose(pred_dist.variance, p * (1.0 - p))
+
+
+@pytest.mark.parametrize("n", [1, 2, 10])
+def test_bernoulli_predict_gaussian_distribution(n: int, monkeypatch):
+    _, latent_mean, latent_cov = _compute_latent_dist(n)
+    latent_dist = GaussianDistribution(latent_mean, cola.PSD(Dense(latent_cov)))
+
+    # The marginal variances should come from `cola.diag`, not the dense covariance.
+    def dense_covariance(self):
+        raise AssertionError("The dense covariance should not be formed.")
+
+    monkeypatch.setattr(GaussianDistribution, "covariance", dense_covariance)
+    pred_dist = Bernoulli(num_datapoints=n)(latent_dist)
+
+    p = inv_probit(latent_mean / jnp.sqrt(1.0 + jnp.diagonal(latent_cov)))
+    assert np.allclose(pred_dist.mean, p)
 
 
 @pytest.mark.parametrize("n", [1, 2, 10])
@@ -109,3 +151,107 @@ def test_poisson_likelihood(n: int):
     # Check predictive mean and variance.
     rate = jnp.exp(latent_mean)
     assert (pred_dist.mean == rate).all()
+
+
+@pytest.mark.parametrize(
+    "likelihood, y",
+    [
+        (Gaussian(num_datapoints=5, obs_stddev=0.5), jnp.linspace(-2.0, 2.0, 5)),
+        (Bernoulli(num_datapoints=5), jnp.array([0.0, 1.0, 1.0, 0.0, 1.0])),
+        (Poisson(num_datapoints=5), jnp.array([0.0, 1.0, 2.0, 3.0, 10.0])),
+    ],
+)
+def test_log_prob(likelihood, y):
+    f = jnp.linspace(-3.0, 3.0, 5)
+    assert np.allclose(
+        likelihood.log_prob(f, y), likelihood.link_function(f).log_prob(y)
+    )
+
+
+def test_gaussian_log_prob_dtype():
+    likelihood = Gaussian(num_datapoints=5, obs_stddev=jnp.array(0.5, jnp.float64))
+    f = jnp.linspace(-3.0, 3.0, 5, dtype=jnp.float32)
+    y = jnp.linspace(-2.0, 2.0, 5, dtype=jnp.float32)
+
+    log_prob = likelihood.log_prob(f, y)
+    assert log_prob.dtype == likelihood.link_function(f).log_prob(y).dtype
+    assert log_prob.dtype == jnp.float32
+
+
+def test_log_prob_overridden_link_function():
+    class LogitBernoulli(Bernoulli):
+        def link_function(self, f):
+            return npd.BernoulliLogits(logits=f)
+
+    likelihood = LogitBernoulli(num_datapoints=5)
+    f = jnp.linspace(-3.0, 3.0, 5)
+    y = jnp.array([0.0, 1.0, 1.0, 0.0, 1.0])
+    assert np.allclose(
+        likelihood.log_prob(f, y), likelihood.link_function(f).log_prob(y)
+    )
+
+
+@pytest.mark.parametrize("likelihood", [Bernoulli, Poisson])
+def test_predict_batch_shape(likelihood):
+    n, b = 4, 3
+    likelihood = likelihood(num_datapoints=n)
+    latent_dist, latent_mean, latent_cov = _compute_latent_dist(n)
+    latent_dists = [
+        npd.MultivariateNormal(latent_mean + i, covariance_matrix=(i + 1) * latent_cov)
+        for i in range(b)
+    ]
+    batched = npd.MultivariateNormal(
+        jnp.stack([d.mean for d in latent_dists]),
+        covariance_matrix=jnp.stack([d.covariance_matrix for d in latent_dists]),
+    )
+
+    pred_dists = likelihood.predict(batched)
+    assert pred_dists.batch_shape == (b, n)
+
+    for i, latent_dist in enumerate(latent_dists):
+        expected = likelihood.predict(latent_dist)
+        assert np.allclose(pred_dists.mean[i], expected.mean)
+        assert np.allclose(pred_dists.variance[i], expected.variance)
+
+
+@pytest.mark.parametrize("n", [1, 2, 10])
+def test_predict_from_moments(n: int):
+    latent_dist, latent_mean, latent_cov = _compute_latent_dist(n)
+    variance = jnp.diagonal(latent_cov)
+
+    bernoulli = Bernoulli(num_datapoints=n)
+    pred_dist = bernoulli.predict_from_moments(latent_mean, variance)
+    assert np.allclose(pred_dist.mean, bernoulli.predict(latent_dist).mean)
+
+    poisson = Poisson(num_datapoints=n)
+    pred_dist = poisson.predict_from_moments(latent_mean)
+    assert np.allclose(pred_dist.mean, poisson.predict(latent_dist).mean)
+
+
+@pytest.mark.parametrize("dtype", [jnp.float32, jnp.float64])
+def test_poisson_large_log_rate(dtype):
+    likelihood = Poisson(num_datapoints=1000)
+    f = jnp.full((1000,), 1000.0, dtype=dtype).at[0].set(1.0)
+    y = jnp.arange(1000, dtype=dtype)
+
+    assert jnp.isfinite(likelihood.link_function(f).mean).all()
+    # Summing many clipped terms, as in the ELBO, must not overflow either.
+    assert jnp.isfinite(likelihood.log_prob(f, y).sum())
+    assert jnp.isfinite(likelihood.link_function(f).log_prob(y).sum())
+
+
+def test_inv_probit():
+    x = jnp.linspace(-10.0, 10.0, 1001)
+    jitter = 1e-3
+    expected = 0.5 * (1.0 + jsp.special.erf(x / jnp.sqrt(2.0))) * (1 - 2 * jitter)
+    expected += jitter
+
+    p = inv_probit(x)
+    assert np.allclose(p, expected)
+    assert (p > 0.0).all() and (p < 1.0).all()
+
+
+def test_inv_probit_grad():
+    x = jnp.linspace(-5.0, 5.0, 101)
+    grad = jax.vmap(jax.grad(inv_probit))(x)
+    assert np.allclose(grad, (1.0 - 2e-3) * jsp.stats.norm.pdf(x))
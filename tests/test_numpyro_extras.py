@@ -4,9 +4,13 @@ from jax import (
 )
 import jax.numpy as jnp
 import numpy as np
+import numpyro.distributions as npd
 import pytest
 
-from gpjax.numpyro_extras import FillTriangularTransform
+from gpjax.numpyro_extras import (
+    FillTriangularTransform,
+    LogRatePoisson,
+)
 
 
 # Helper function to generate a test input vector for a given matrix size.
@@ -201,3 +205,49 @@ def test_inverse_non_square_error():
     batched_non_square = jnp.ones((2, 3, 4))  # Batch of 2 matrices of shape 3x4
     with pytest.raises(ValueError, match="Input matrix must be square"):
         ft.inv(batched_non_square)
+
+
+def test_log_rate_poisson():
+    """
+    Test that LogRatePoisson matches numpyro's Poisson with rate = exp(log_rate),
+    including under jit where the distribution is passed through as a pytree.
+    """
+    log_rate = jnp.linspace(-3.0, 3.0, 7)
+    value = jnp.arange(7.0)
+    dist = LogRatePoisson(log_rate=log_rate)
+    reference = npd.Poisson(rate=jnp.exp(log_rate))
+
+    np.testing.assert_allclose(dist.mean, reference.mean, rtol=1e-6)
+    np.testing.assert_allclose(
+        dist.log_prob(value), reference.log_prob(value), rtol=1e-5
+    )
+
+    log_prob = jit(lambda d, v: d.log_prob(v))
+    np.testing.assert_allclose(
+        log_prob(dist, value), reference.log_prob(value), rtol=1e-5
+    )
+
+
+def test_log_rate_poisson_sparse(monkeypatch):
+    """
+    Test that LogRatePoisson honours is_sparse by deferring to numpyro's sparse
+    log_prob, which only evaluates the rate-dependent terms where value > 0.
+    """
+    log_rate = jnp.linspace(-3.0, 3.0, 7)
+    value = jnp.array([0.0, 0.0, 2.0, 0.0, 1.0, 0.0, 3.0])
+    reference = npd.Poisson(rate=jnp.exp(log_rate), is_sparse=True).log_prob(value)
+
+    calls = []
+    poisson_log_prob = npd.Poisson.log_prob
+
+    def spy(self, value):
+        calls.append(self.is_sparse)
+        return poisson_log_prob(self, value)
+
+    monkeypatch.setattr(npd.Poisson, "log_prob", spy)
+    dense = LogRatePoisson(log_rate=log_rate).log_prob(value)
+    sparse = LogRatePoisson(log_rate=log_rate, is_sparse=True).log_prob(value)
+
+    assert calls == [True]
+    np.testing.assert_allclose(dense, reference, rtol=1e-5)
+    np.testing.assert_allclose(sparse, reference, rtol=1e-5)